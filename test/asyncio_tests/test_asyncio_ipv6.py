@@ -18,10 +18,9 @@ import test
 import unittest
 from test import SkipTest
 from test.asyncio_tests import AsyncIOTestCase, asyncio_test
-from test.test_environment import connected, db_password, db_user, env
+from test.test_environment import db_password, db_user, env, is_ipv6_connectable
 
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure
+from pymongo import ReturnDocument
 
 
 class MotorIPv6Test(AsyncIOTestCase):
@@ -32,13 +31,7 @@ class MotorIPv6Test(AsyncIOTestCase):
             "127.0.0.1",
         ), "This unittest isn't written to test IPv6 with host %s" % repr(env.host)
 
-        try:
-            connected(
-                MongoClient(
-                    "[::1]", username=db_user, password=db_password, serverSelectionTimeoutMS=100
-                )
-            )
-        except ConnectionFailure:
+        if not is_ipv6_connectable(env.port):
             # Either mongod was started without --ipv6
             # or the OS doesn't support it (or both).
             raise SkipTest("No IPV6")
@@ -50,8 +43,13 @@ class MotorIPv6Test(AsyncIOTestCase):
 
         cx = self.asyncio_client(uri=cx_string)
         collection = cx.motor_test.test_collection
-        await collection.insert_one({"dummy": "object"})
-        self.assertTrue(await collection.find_one({"dummy": "object"}))
+        doc = await collection.find_one_and_update(
+            {"dummy": "object"},
+            {"$set": {"dummy": "object"}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        self.assertEqual("object", doc["dummy"])
 
 
 if __name__ == "__main__":
@@ -15,7 +15,6 @@
 """Test AsyncIOMotorClient with SSL."""
 
 import asyncio
-import gc
 import test
 import unittest
 from test.asyncio_tests import asyncio_test
@@ -37,22 +36,39 @@ from motor.motor_asyncio import AsyncIOMotorClient
 
 
 class TestAsyncIOSSL(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         if not test.env.server_is_resolvable:
             raise SkipTest(
                 "No hosts entry for 'server'. Cannot validate hostname in the certificate"
             )
 
+        # Ensure that the event loop is passed explicitly in Motor.
         asyncio.set_event_loop(None)
-        self.loop = asyncio.new_event_loop()
+        cls.loop = asyncio.new_event_loop()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.stop()
+        cls.loop.run_forever()
+        cls.loop.close()
 
-    def tearDown(self):
-        if not hasattr(self, "loop"):
-            return
-        self.loop.stop()
-        self.loop.run_forever()
-        self.loop.close()
-        gc.collect()
+    def setUp(self):
+        # Registered first, so it runs after the clients' close() cleanups.
+        self.addCleanup(self.drain_loop)
+
+    def drain_loop(self):
+        """Let callbacks scheduled by closed clients run before the next test."""
+        self.loop.run_until_complete(asyncio.sleep(0))
+
+    def ssl_client(self, *args, **kwargs):
+        """Get an AsyncIOMotorClient configured with the test certificates."""
+        kwargs.setdefault("tlsCertificateKeyFile", CLIENT_PEM)
+        kwargs.setdefault("tlsCAFile", CA_PEM)
+        kwargs.setdefault("io_loop", self.loop)
+        client = AsyncIOMotorClient(*args, **kwargs)
+        self.addCleanup(client.close)
+        return client
 
     def test_config_ssl(self):
         # This test doesn't require a running mongod.
@@ -82,26 +98,12 @@ class TestAsyncIOSSL(unittest.TestCase):
         if test.env.auth:
             raise SkipTest("Can't test with auth")
 
-        client = AsyncIOMotorClient(
-            env.host,
-            env.port,
-            tlsCertificateKeyFile=CLIENT_PEM,
-            tlsCAFile=CA_PEM,
-            io_loop=self.loop,
-        )
+        client = self.ssl_client(env.host, env.port)
 
         await client.db.collection.find_one()
         response = await client.admin.command("ismaster")
         if "setName" in response:
-            client = AsyncIOMotorClient(
-                env.host,
-                env.port,
-                tls=True,
-                tlsCertificateKeyFile=CLIENT_PEM,
-                tlsCAFile=CA_PEM,
-                replicaSet=response["setName"],
-                io_loop=self.loop,
-            )
+            client = self.ssl_client(env.host, env.port, tls=True, replicaSet=response["setName"])
 
             await client.db.collection.find_one()
 
@@ -113,26 +115,13 @@ class TestAsyncIOSSL(unittest.TestCase):
         if test.env.auth:
             raise SkipTest("Can't test with auth")
 
-        client = AsyncIOMotorClient(
-            env.host,
-            env.port,
-            tlsCertificateKeyFile=CLIENT_PEM,
-            tlsCAFile=CA_PEM,
-            io_loop=self.loop,
-        )
+        client = self.ssl_client(env.host, env.port)
 
         await client.db.collection.find_one()
         response = await client.admin.command("ismaster")
 
         if "setName" in response:
-            client = AsyncIOMotorClient(
-                env.host,
-                env.port,
-                replicaSet=response["setName"],
-                tlsCertificateKeyFile=CLIENT_PEM,
-                tlsCAFile=CA_PEM,
-                io_loop=self.loop,
-            )
+            client = self.ssl_client(env.host, env.port, replicaSet=response["setName"])
 
             await client.db.collection.find_one()
 
@@ -144,13 +133,7 @@ class TestAsyncIOSSL(unittest.TestCase):
         if test.env.auth:
             raise SkipTest("Can't test with auth")
 
-        client = AsyncIOMotorClient(
-            test.env.fake_hostname_uri,
-            tlsCertificateKeyFile=CLIENT_PEM,
-            tlsAllowInvalidCertificates=True,
-            tlsCAFile=CA_PEM,
-            io_loop=self.loop,
-        )
+        client = self.ssl_client(test.env.fake_hostname_uri, tlsAllowInvalidCertificates=True)
 
         await client.admin.command("ismaster")
 
@@ -162,38 +145,22 @@ class TestAsyncIOSSL(unittest.TestCase):
         if test.env.auth:
             raise SkipTest("Can't test with auth")
 
-        client = AsyncIOMotorClient(
-            env.host,
-            env.port,
-            tls=True,
-            tlsCertificateKeyFile=CLIENT_PEM,
-            tlsCAFile=CA_PEM,
-            io_loop=self.loop,
-        )
+        client = self.ssl_client(env.host, env.port, tls=True)
 
         response = await client.admin.command("ismaster")
         with self.assertRaises(ConnectionFailure):
             # Create client with hostname 'server', not 'localhost',
             # which is what the server cert presents.
-            client = AsyncIOMotorClient(
-                test.env.fake_hostname_uri,
-                serverSelectionTimeoutMS=1000,
-                tlsCertificateKeyFile=CLIENT_PEM,
-                tlsCAFile=CA_PEM,
-                io_loop=self.loop,
-            )
+            client = self.ssl_client(test.env.fake_hostname_uri, serverSelectionTimeoutMS=1000)
 
             await client.db.collection.find_one()
 
         if "setName" in response:
             with self.assertRaises(ConnectionFailure):
-                client = AsyncIOMotorClient(
+                client = self.ssl_client(
                     test.env.fake_hostname_uri,
                     serverSelectionTimeoutMS=1000,
                     replicaSet=response["setName"],
-                    tlsCertificateKeyFile=CLIENT_PEM,
-                    tlsCAFile=CA_PEM,
-                    io_loop=self.loop,
                 )
 
                 await client.db.collection.find_one()
@@ -17,7 +17,7 @@
 import os
 import socket
 import sys
-from functools import wraps
+from functools import lru_cache, wraps
 from test.utils import create_user
 from test.version import Version
 from unittest import SkipTest
@@ -106,6 +106,27 @@ def is_server_resolvable():
         socket.setdefaulttimeout(socket_timeout)
 
 
+@lru_cache(maxsize=None)
+def is_ipv6_connectable(port):
+    """Returns True if mongod accepts connections on [::1]:port.
+
+    The result is cached, so the probe runs at most once per process.
+    """
+    if not socket.has_ipv6:
+        return False
+
+    client = pymongo.MongoClient(
+        "[::1]", port, username=db_user, password=db_password, serverSelectionTimeoutMS=100
+    )
+    try:
+        connected(client)
+        return True
+    except pymongo.errors.ConnectionFailure:
+        return False
+    finally:
+        client.close()
+
+
 class TestEnvironment:
     __test__ = False
 
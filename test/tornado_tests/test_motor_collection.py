@@ -116,11 +116,13 @@ class MotorCollectionTest(MotorTest):
         await collection.insert_one({"_id": 2})
 
         # Violate a unique index in one of many updates, handle error.
-        with self.assertRaises(BulkWriteError):
+        with self.assertRaises(BulkWriteError) as context:
             await collection.insert_many([{"_id": 1}, {"_id": 2}, {"_id": 3}])  # Already exists
 
         # First insert should have succeeded, but not second or third.
-        self.assertEqual(set([1, 2]), set(await collection.distinct("_id")))
+        details = context.exception.details
+        self.assertEqual(1, details["nInserted"])
+        self.assertEqual([1], [error["index"] for error in details["writeErrors"]])
 
     @gen_test
     async def test_delete_one(self):
@@ -149,8 +151,8 @@ class MotorCollectionTest(MotorTest):
         await coll.with_options(write_concern=WriteConcern(0)).insert_one({"_id": 1})
 
         # The insert is eventually executed.
-        while not (await coll.count_documents({})):
-            await gen.sleep(0.1)
+        while not (await coll.find_one({"_id": 1})):
+            await gen.sleep(0.01)
 
     @gen_test
     async def test_unacknowledged_update(self):
@@ -163,7 +165,7 @@ class MotorCollectionTest(MotorTest):
         )
 
         while not (await coll.find_one({"a": 1})):
-            await gen.sleep(0.1)
+            await gen.sleep(0.01)
 
     @ignore_deprecations
     @gen_test
@@ -17,11 +17,10 @@
 import test
 import unittest
 from test import SkipTest
-from test.test_environment import connected, db_password, db_user, env
+from test.test_environment import db_password, db_user, env, is_ipv6_connectable
 from test.tornado_tests import MotorTest
 
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure
+from pymongo import ReturnDocument
 from tornado.testing import gen_test
 
 import motor
@@ -35,13 +34,7 @@ class MotorIPv6Test(MotorTest):
             "127.0.0.1",
         ), "This unittest isn't written to test IPv6 with host %s" % repr(env.host)
 
-        try:
-            connected(
-                MongoClient(
-                    "[::1]", username=db_user, password=db_password, serverSelectionTimeoutMS=100
-                )
-            )
-        except ConnectionFailure:
+        if not is_ipv6_connectable(env.port):
             # Either mongod was started without --ipv6
             # or the OS doesn't support it (or both).
             raise SkipTest("No IPV6")
@@ -53,8 +46,13 @@ class MotorIPv6Test(MotorTest):
 
         cx = motor.MotorClient(cx_string, io_loop=self.io_loop)
         collection = cx.motor_test.test_collection
-        await collection.insert_one({"dummy": "object"})
-        self.assertTrue(await collection.find_one({"dummy": "object"}))
+        doc = await collection.find_one_and_update(
+            {"dummy": "object"},
+            {"$set": {"dummy": "object"}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        self.assertEqual("object", doc["dummy"])
 
 
 if __name__ == "__main__":